@@ -1,10 +1,26 @@
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, TypedDict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from enum import Enum
 import logging
 
+try:
+    import orjson as _json  # C parser, several times faster on big payloads
+except ImportError:
+    _json = json
+
+try:
+    import ijson  # incremental parser for streaming large list responses
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
 
 class OrderAction(str, Enum):
     BUY = 'BUY'
@@ -221,75 +237,157 @@ class RotmanInteractiveTraderApi:
     Partial implementation of https://rit.306w.ca/RIT-REST-API-DEV/1.0.3/.
     """
 
-    def __init__(self, api_key: str, api_host: str = 'http://localhost:9999') -> None:
+    def __init__(self, api_key: str, api_host: str = 'http://localhost:9999',
+                 pool_connections: int = 4, pool_maxsize: int = 32) -> None:
         self.api_key = api_key
         self.api_host = api_host
         self.api_version = 'v1'
+        self._base_url = f'{api_host}/{self.api_version}/'
+
+        # Single keep-alive session: avoids a fresh TCP handshake per call and
+        # lets urllib3 pool connections across the polling loop. Retries cover
+        # transient gateway errors without paying a full reconnect.
+        self._session = requests.Session()
+        self._session.headers.update({
+            'X-API-Key': api_key,
+            'Accept': 'application/json'
+        })
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            max_retries=Retry(total=2, backoff_factor=0.05, status_forcelist=[502, 503, 504]),
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+        # Case status only changes at tick granularity, so a short TTL cache
+        # saves a round-trip on hot paths like place_order -> is_market_open.
+        self._case_cache: Optional[tuple[float, Case]] = None
+        self._case_ttl = 0.25
+
+        # Pool for overlapping independent GETs on the shared session
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='rit')
+
+        # Whether the server accepts a multi-status orders query (probed lazily)
+        self._multi_status_ok: Optional[bool] = None
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def __enter__(self) -> 'RotmanInteractiveTraderApi':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _get(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """GET fast path: precomputed base URL, no method dispatch or debug branch."""
+        return _json.loads(self._session.get(self._base_url + endpoint, params=params).content)
 
     def make_request(self, method: str, endpoint: str, params: Optional[dict[str, Any]] = None) -> Any:
-        req = requests.Request(
-            method=method,
-            url=f'{self.api_host}/{self.api_version}/{endpoint}',
-            headers={
-                'X-API-Key': self.api_key,
-                'Accept': 'application/json'
-            },
-            params=params
-        )
-        p = req.prepare()
-        s = requests.Session()
-        logging.debug(f'{p.method} {p.url}')
-        r = s.send(p).json()
-        if not p.method == 'GET':
-            logging.debug(f'{p.method} {p.url} {json.dumps(r, indent=2)}')
+        url = self._base_url + endpoint
+        logger.debug('%s %s', method, url)
+        r = _json.loads(self._session.request(method, url, params=params).content)
+        if not method.upper() == 'GET' and logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s %s %s', method, url, json.dumps(r, indent=2))
         return r
 
+    def iter_request(self, endpoint: str, params: Optional[dict[str, Any]] = None):
+        """Stream a large GET list response item by item.
+
+        With ijson installed the response body is parsed incrementally, so
+        items a caller filters out are never materialized as Python dicts.
+        Falls back to a full parse when ijson is unavailable.
+        """
+        url = self._base_url + endpoint
+        logger.debug('%s %s (stream)', 'get', url)
+        if ijson is None:
+            yield from self.make_request('get', endpoint, params)
+            return
+        resp = self._session.get(url, params=params, stream=True)
+        try:
+            yield from ijson.items(resp.raw, 'item')
+        finally:
+            resp.close()
+
     def get_case(self) -> Case:
-        return self.make_request('get', 'case')
+        if self._case_cache is not None:
+            ts, case = self._case_cache
+            if time.monotonic() - ts < self._case_ttl:
+                return case
+        case = self._get('case')
+        self._case_cache = (time.monotonic(), case)
+        return case
+
+    def invalidate_case(self) -> None:
+        self._case_cache = None
 
     def is_market_open(self) -> bool:
         return self.get_case()['status'] == 'ACTIVE'
 
     def get_orders(self, status: OrderStatus = OrderStatus.OPEN) -> list[Order]:
-        return self.make_request('get', 'orders', {
-            'status': status.value
+        return self._get('orders', {
+            'status': status
         })
 
     def get_time_and_sales(self, ticker: str) -> list[TimeAndSalesEntry]:
-        return self.make_request('get', 'securities/tas', {
+        return self._get('securities/tas', {
             'ticker': ticker
         })
 
     def get_history(self, ticker: str) -> list[HistoryEntry]:
-        return self.make_request('get', 'securities/history', {
+        return self._get('securities/history', {
             'ticker': ticker
         })
 
     def get_trader(self) -> Trader:
-        return self.make_request('get', 'trader')
+        return self._get('trader')
 
     def get_limits(self) -> dict[str, Limit]:
-        limits: dict[str, Limit] = {}
-        for item in self.make_request('get', 'limits'):
-            limits[item['name']] = item
-        return limits
+        return {item['name']: item for item in self._get('limits')}
 
     def get_portfolio(self) -> dict[str, Security]:
-        portfolio: dict[str, Security] = {}
-        for item in self.make_request('get', 'securities'):
-            portfolio[item['ticker']] = item
-        return portfolio
+        return {item['ticker']: item for item in self._get('securities')}
+
+    def get_tick_state(self) -> tuple[Case, dict[str, Security]]:
+        """Fetch case and portfolio concurrently for one polling-loop pass.
+
+        The portfolio request is dispatched on the executor so it overlaps
+        with the case fetch (which is usually served from the TTL cache).
+        """
+        f_portfolio = self._executor.submit(self.get_portfolio)
+        return self.get_case(), f_portfolio.result()
 
     def get_order_book(self, ticker: str, limit: int = 20) -> OrderBook:
-        return self.make_request('get', 'securities/book', {
+        return self._get('securities/book', {
             'ticker': ticker,
             'limit': limit
         })
 
+    def get_bundle(self, endpoints: list[tuple[str, Optional[dict[str, Any]]]]) -> list[Any]:
+        """Fetch several GET endpoints concurrently, preserving order."""
+        futures = [self._executor.submit(self.make_request, 'get', ep, params)
+                   for ep, params in endpoints]
+        return [f.result() for f in futures]
+
     def get_order_fills(self) -> list[Order]:
-        partial = list(filter(lambda order: order['quantity_filled'] > 0, self.get_orders(OrderStatus.OPEN)))
-        transacted = self.get_orders(OrderStatus.TRANSACTED)
-        return partial + transacted
+        # Prefer a single multi-status query when the server supports it
+        if self._multi_status_ok is not False:
+            combined = self._get('orders', {'status': 'OPEN,TRANSACTED'})
+            if isinstance(combined, list):
+                self._multi_status_ok = True
+                return [order for order in combined
+                        if order['status'] == OrderStatus.TRANSACTED
+                        or order['quantity_filled'] > 0]
+            self._multi_status_ok = False
+
+        f_transacted = self._executor.submit(self.get_orders, OrderStatus.TRANSACTED)
+        # Stream OPEN orders so zero-fill ones are filtered during the parse
+        partial = [order for order in self.iter_request('orders', {'status': OrderStatus.OPEN})
+                   if order['quantity_filled'] > 0]
+        return partial + f_transacted.result()
 
     def cancel_all_orders(self, ticker: Optional[str] = None) -> CancelResponse:
         return self.make_request('post', 'commands/cancel', {
@@ -302,9 +400,9 @@ class RotmanInteractiveTraderApi:
             raise Exception('Market is closed.')
         return self.make_request('post', 'orders', params={
             'ticker': ticker,
-            'type': order_type.value,
+            'type': order_type,
             'quantity': quantity,
-            'action': action.value,
+            'action': action,
             'price': price,
             'dry_run': 1 if dry_run else None
         })
@@ -315,13 +413,10 @@ class RotmanInteractiveTraderApi:
         })
 
     def get_assets(self) -> dict[str, Asset]:
-        assets: dict[str, Asset] = {}
-        for item in self.make_request('get', 'assets'):
-            assets[item['ticker']] = item
-        return assets
+        return {item['ticker']: item for item in self._get('assets')}
 
     def get_leases(self) -> list[AssetLease]:
-        return self.make_request('get', 'leases')
+        return self._get('leases')
 
     def lease_asset(self, ticker: str) -> AssetLease:
         return self.make_request('post', 'leases', {
@@ -5,7 +5,9 @@ top signals that exceed the minimum threshold.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Callable, TYPE_CHECKING
 
 import numpy as np
@@ -15,28 +17,33 @@ from params import AllocatorConfig
 if TYPE_CHECKING:
     from strategies.base import Order
 
+# Imported lazily once: strategies.base does not import this module at runtime,
+# but the package may still be mid-import when allocator is first loaded.
+_Order = None
 
-@dataclass
+
+@dataclass(slots=True)
 class StrategySpec:
-    """Per-strategy signal input."""
+    """Per-strategy signal input.
+
+    A per-tick value object: the derived quantities the allocator reads
+    repeatedly (ranking, thresholding, direction) are computed once at
+    construction rather than on every property access.
+    """
     name: str
     signal: float               # Spread value (+ = short spread, - = long spread)
     sigma: float                # Normalization factor (e.g., std dev)
     build_pos: Callable[[dict], dict]  # prices → shares dict for +1 unit of short spread
 
-    @property
-    def abs_signal(self) -> float:
-        return abs(self.signal)
+    abs_signal: float = field(init=False)
+    direction: int = field(init=False)   # +1 short spread, -1 long spread
+    strength: float = field(init=False)  # |signal| / sigma, for ranking
 
-    @property
-    def direction(self) -> int:
-        """Direction for position: +1 if signal > 0 (short spread), -1 if signal < 0 (long spread)."""
-        return int(np.sign(self.signal)) if self.signal != 0 else 0
-
-    @property
-    def strength(self) -> float:
-        """Signal strength for ranking."""
-        return self.abs_signal / (self.sigma + 1e-9)
+    def __post_init__(self) -> None:
+        self.abs_signal = abs(self.signal)
+        # Branchless sign; scalar np.sign pays ufunc dispatch for no benefit here
+        self.direction = (self.signal > 0) - (self.signal < 0)
+        self.strength = self.abs_signal / (self.sigma + 1e-9)
 
 
 class PortfolioAllocator:
@@ -57,7 +64,9 @@ class PortfolioAllocator:
     def __init__(self, config: AllocatorConfig | None = None, width: dict[str, float] | None = None):
         self.config = config or AllocatorConfig()
         self.width = width or {}
-        self._prev_pos: dict[str, float] = {leg: 0.0 for leg in self.LEGS}
+        self._leg_idx = {leg: i for i, leg in enumerate(self.LEGS)}
+        self._n = len(self.LEGS)
+        self._prev_arr = np.zeros(self._n, dtype=np.float64)
 
         # Compute max delta shares from turnover budget
         self._max_dshares = {}
@@ -68,11 +77,21 @@ class PortfolioAllocator:
                 self.config.max_shares.get(leg, 300_000)
             )
 
+        # Per-leg limits as fixed-order arrays so clips are single np.clip calls
+        self._max_shares_arr = np.array(
+            [self.config.max_shares.get(leg, 300_000) for leg in self.LEGS], dtype=np.float64)
+        self._max_dshares_arr = np.array(
+            [self._max_dshares[leg] for leg in self.LEGS], dtype=np.float64)
+
         # Position tracking for risk management
         # {strategy_name: {'entry_spread': float, 'entry_tick': int, 'direction': int}}
         self._positions: dict[str, dict] = {}
         self._current_tick: int = 0
 
+        # Unit-position cache per strategy, keyed by a rounded prices signature
+        # (hedge ratios barely move tick-to-tick, so the array is often reusable)
+        self._build_cache: dict[str, tuple[tuple, np.ndarray]] = {}
+
     def allocate(
         self,
         specs: list[StrategySpec],
@@ -91,44 +110,26 @@ class PortfolioAllocator:
         """
         self._current_tick += 1
 
-        # Build lookup for current signals
-        signal_lookup = {s.name: s for s in specs}
-
-        # 1. Apply risk management to existing positions
+        # 1. Apply risk management to existing positions. The name lookup is
+        # only needed while positions are tracked, so skip the build otherwise.
+        # Exit when: the strategy stopped reporting, stop loss (spread blew
+        # past the absolute threshold), take profit (spread reverted near the
+        # mean), or the hold-time limit was hit.
         forced_exits = set()
-        for name, pos_info in list(self._positions.items()):
-            spec = signal_lookup.get(name)
-            if spec is None:
-                # Strategy no longer providing signal - exit
-                forced_exits.add(name)
-                continue
-
-            entry_spread = pos_info['entry_spread']
-            entry_tick = pos_info['entry_tick']
-            direction = pos_info['direction']
-            ticks_held = self._current_tick - entry_tick
-
-            # Current spread (same direction as entry)
-            current_spread = spec.abs_signal
-
-            # Check stop loss: spread exceeded absolute threshold
-            if current_spread > self.config.stop_loss_z:
-                forced_exits.add(name)
-                continue
-
-            # Check take profit: spread reverted near mean
-            if current_spread < self.config.take_profit_z:
-                forced_exits.add(name)
-                continue
-
-            # Check time limit
-            if ticks_held >= self.config.max_hold_ticks:
-                forced_exits.add(name)
-                continue
-
-        # Remove forced exits from position tracking
-        for name in forced_exits:
-            if name in self._positions:
+        if self._positions:
+            signal_lookup = {s.name: s for s in specs}
+            stop_z = self.config.stop_loss_z
+            take_z = self.config.take_profit_z
+            max_hold = self.config.max_hold_ticks
+            tick_now = self._current_tick
+            for name, pos_info in self._positions.items():
+                spec = signal_lookup.get(name)
+                if (spec is None
+                        or spec.abs_signal > stop_z
+                        or spec.abs_signal < take_z
+                        or tick_now - pos_info['entry_tick'] >= max_hold):
+                    forced_exits.add(name)
+            for name in forced_exits:
                 del self._positions[name]
 
         # 2. Filter by minimum threshold (excluding forced exits)
@@ -141,9 +142,19 @@ class PortfolioAllocator:
             self._positions.clear()
             return self._flatten_positions(current_pos), []
 
-        # 3. Rank by strength and take top N
-        eligible.sort(key=lambda s: s.strength, reverse=True)
-        top_specs = eligible[:self.config.top_n]
+        # 3. Rank by strength and take top N. With many eligible signals a
+        # partial selection beats a full Python-keyed sort; the final ordering
+        # sort then only touches top_n elements.
+        top_n = self.config.top_n
+        if len(eligible) > top_n:
+            strengths_all = np.fromiter((s.strength for s in eligible),
+                                        dtype=np.float64, count=len(eligible))
+            idx = np.argpartition(-strengths_all, top_n)[:top_n]
+            idx = idx[np.argsort(-strengths_all[idx])]
+            top_specs = [eligible[i] for i in idx]
+        else:
+            eligible.sort(key=attrgetter('strength'), reverse=True)
+            top_specs = eligible
         active_names = [s.name for s in top_specs]
 
         # 4. Track new entries
@@ -155,44 +166,56 @@ class PortfolioAllocator:
                     'direction': spec.direction,
                 }
 
-        # 5. Compute weights proportional to strength
-        strengths = [s.strength for s in top_specs]
-        total_strength = sum(strengths)
-        weights = [s / total_strength for s in strengths]
-
-        # 6. Allocate gross across top signals
+        # 5. Compute weights proportional to strength (single vectorized pass).
+        # One survivor is common after filtering; its weight is trivially 1.
+        if len(top_specs) == 1:
+            weights = [1.0]
+        else:
+            strengths = np.fromiter((s.strength for s in top_specs),
+                                    dtype=np.float64, count=len(top_specs))
+            weights = strengths / strengths.sum()
+
+        # 6. Allocate gross across top signals: stack unit positions into an
+        # N x legs matrix and collapse the budget split into one GEMV
         effective_gross = self.config.gross_limit
+        px_arr = self._to_arr(prices)
+        px_key = tuple(round(p, 4) for p in px_arr.tolist())
 
-        pos = {leg: 0.0 for leg in self.LEGS}
+        k = len(top_specs)
+        legs_matrix = np.empty((k, self._n), dtype=np.float64)
+        for i, spec in enumerate(top_specs):
+            legs_matrix[i] = self._unit_pos(spec, prices, px_key)
 
-        for spec, weight in zip(top_specs, weights):
-            d = spec.direction
+        g_unit = np.abs(legs_matrix * px_arr).sum(axis=1)
+        dirs = np.fromiter((s.direction for s in top_specs), dtype=np.float64, count=k)
 
-            unit_pos = spec.build_pos(prices)
-            g_unit = self._gross(unit_pos, prices)
+        # Per-strategy shares of the gross budget (zero where the unit is empty)
+        units = np.asarray(weights, dtype=np.float64) * dirs
+        live = g_unit > 0
+        units[live] *= effective_gross / g_unit[live]
+        units[~live] = 0.0
 
-            if g_unit > 0:
-                # Allocate fraction of effective gross budget to this strategy
-                units = (weight * effective_gross / g_unit) * d
-                for leg, shares in unit_pos.items():
-                    if leg in pos:
-                        pos[leg] += shares * units
+        pos_arr = legs_matrix.T @ units
 
         # 7. Project into constraints
-        pos = self._project_to_limits(pos, prices)
+        pos_arr = self._project_to_limits(pos_arr, px_arr)
 
         # 8. Apply turnover cap
-        prev = current_pos or self._prev_pos
-        pos = self._apply_turnover_cap(prev, pos)
+        prev_arr = self._to_arr(current_pos) if current_pos else self._prev_arr
+        pos_arr = self._apply_turnover_cap(prev_arr, pos_arr)
 
-        self._prev_pos = pos.copy()
-        return pos, active_names
+        self._prev_arr = pos_arr
+        return dict(zip(self.LEGS, pos_arr.tolist())), active_names
 
     def _flatten_positions(self, current_pos: dict[str, float] | None) -> dict[str, float]:
         """Gradually flatten all positions (respecting turnover cap)."""
-        prev = current_pos or self._prev_pos
-        target = {leg: 0.0 for leg in self.LEGS}
-        return self._apply_turnover_cap(prev, target)
+        prev_arr = self._to_arr(current_pos) if current_pos else self._prev_arr
+        if not prev_arr.any():
+            # Already flat (the common quiet-market case): the capped unwind
+            # below would just produce zeros, so skip the array math
+            return dict.fromkeys(self.LEGS, 0.0)
+        target = self._apply_turnover_cap(prev_arr, np.zeros(self._n, dtype=np.float64))
+        return dict(zip(self.LEGS, target.tolist()))
 
     def positions_to_orders(
         self,
@@ -212,94 +235,113 @@ class PortfolioAllocator:
         Returns:
             List of Order objects
         """
-        import logging
-        from strategies.base import Order
-
-        orders = []
-        for ticker in self.LEGS:
-            tgt = target.get(ticker, 0.0)
-            cur = current.get(ticker, 0.0)
-            delta = tgt - cur
-
-            # Skip small changes (dead band: 10% of current or 1000 shares minimum)
-            min_delta = max(1000, abs(cur) * 0.10)
-
-            if debug:
+        global _Order
+        if _Order is None:
+            from strategies.base import Order as _Order
+
+        tgt_arr = self._to_arr(target)
+        cur_arr = self._to_arr(current)
+        px_arr = self._to_arr(prices)
+
+        delta = tgt_arr - cur_arr
+        # Skip small changes (dead band: 10% of current or 1000 shares minimum)
+        min_delta = np.maximum(1000.0, np.abs(cur_arr) * 0.10)
+        mask = np.abs(delta) >= min_delta
+        # Slight price buffer for fills
+        limit_px = px_arr * np.where(delta > 0, 1.001, 0.999)
+
+        if debug:
+            for i, ticker in enumerate(self.LEGS):
                 logging.debug('  %s: cur=%.0f tgt=%.0f delta=%.0f min_delta=%.0f %s',
-                             ticker, cur, tgt, delta, min_delta,
-                             'SKIP' if abs(delta) < min_delta else 'ORDER')
-
-            if abs(delta) < min_delta:
-                continue
+                             ticker, cur_arr[i], tgt_arr[i], delta[i], min_delta[i],
+                             'ORDER' if mask[i] else 'SKIP')
 
-            qty = abs(round(delta))
-            if delta > 0:
-                side = 'BUY'
-                price = prices.get(ticker, 0) * 1.001  # Slight buffer for fills
-            else:
-                side = 'SELL'
-                price = prices.get(ticker, 0) * 0.999
-
-            orders.append(Order(ticker, qty, side, price))
+        orders = []
+        for i in np.nonzero(mask)[0]:
+            d = delta[i]
+            orders.append(_Order(self.LEGS[i], abs(round(d)),
+                                 'BUY' if d > 0 else 'SELL', float(limit_px[i])))
 
         return orders
 
-    def _gross(self, pos: dict[str, float], prices: dict[str, float]) -> float:
+    @property
+    def prev_pos(self) -> dict[str, float]:
+        """Previous target positions, materialized as a dict on demand.
+
+        Internal state stays a flat array (cheap memcpy snapshots, no
+        per-tick dict copies); callers that need a dict pay for it here.
+        """
+        return dict(zip(self.LEGS, self._prev_arr.tolist()))
+
+    def _unit_pos(self, spec: StrategySpec, prices: dict[str, float], px_key: tuple) -> np.ndarray:
+        """Unit position array for a spec, cached while prices are unchanged."""
+        cached = self._build_cache.get(spec.name)
+        if cached is not None and cached[0] == px_key:
+            return cached[1]
+        unit_arr = self._to_arr(spec.build_pos(prices))
+        self._build_cache[spec.name] = (px_key, unit_arr)
+        return unit_arr
+
+    def _to_arr(self, d: dict[str, float]) -> np.ndarray:
+        """Convert a leg-keyed dict to a fixed-order float array."""
+        return np.fromiter((d.get(leg, 0.0) for leg in self.LEGS),
+                           dtype=np.float64, count=self._n)
+
+    def _gross(self, pos_arr: np.ndarray, px_arr: np.ndarray) -> float:
         """Compute gross exposure."""
-        return sum(abs(pos.get(leg, 0) * prices.get(leg, 0)) for leg in self.LEGS)
+        return float(np.abs(pos_arr * px_arr).sum())
 
-    def _net(self, pos: dict[str, float], prices: dict[str, float]) -> float:
+    def _net(self, pos_arr: np.ndarray, px_arr: np.ndarray) -> float:
         """Compute net exposure."""
-        return sum(pos.get(leg, 0) * prices.get(leg, 0) for leg in self.LEGS)
+        return float((pos_arr * px_arr).sum())
 
     def _project_to_limits(
         self,
-        pos: dict[str, float],
-        prices: dict[str, float],
-    ) -> dict[str, float]:
-        """Project positions into constraints (max shares, gross, net)."""
+        pos_arr: np.ndarray,
+        px_arr: np.ndarray,
+    ) -> np.ndarray:
+        """Project positions into constraints (max shares, gross, net).
+
+        Signed notionals are computed once and reused for both the gross and
+        net checks; the net after gross-scaling is derived analytically rather
+        than re-multiplying positions by prices.
+        """
         # Clip to max shares
-        for leg in self.LEGS:
-            max_sh = self.config.max_shares.get(leg, 300_000)
-            pos[leg] = np.clip(pos.get(leg, 0), -max_sh, max_sh)
+        np.clip(pos_arr, -self._max_shares_arr, self._max_shares_arr, out=pos_arr)
+
+        ind = self._leg_idx['IND']
+        notional = pos_arr * px_arr
+        abs_notional = np.abs(notional)
+        g_ind = abs_notional[ind]
+        net = notional.sum()
 
         # Scale non-IND to leave room for IND gross
-        non_ind = [leg for leg in self.LEGS if leg != 'IND']
-        g_ind = abs(pos.get('IND', 0) * prices.get('IND', 0))
         rem = max(0.0, self.config.gross_limit - g_ind)
-        g_non = sum(abs(pos.get(leg, 0) * prices.get(leg, 0)) for leg in non_ind)
-
+        g_non = abs_notional.sum() - g_ind
         if g_non > rem and g_non > 0:
             scale = rem / g_non
-            for leg in non_ind:
-                pos[leg] *= scale
+            pos_arr *= scale
+            pos_arr[ind] /= scale  # IND keeps its full size
+            net = (net - notional[ind]) * scale + notional[ind]
 
         # Final net safety
-        net = self._net(pos, prices)
         if abs(net) > self.config.net_limit and abs(net) > 0:
-            scale = self.config.net_limit / abs(net)
-            for leg in self.LEGS:
-                pos[leg] *= scale
+            pos_arr *= self.config.net_limit / abs(net)
 
-        return pos
+        return pos_arr
 
     def _apply_turnover_cap(
         self,
-        prev: dict[str, float],
-        target: dict[str, float],
-    ) -> dict[str, float]:
+        prev_arr: np.ndarray,
+        target_arr: np.ndarray,
+    ) -> np.ndarray:
         """Apply turnover cap to limit position changes."""
-        result = {}
-        for leg in self.LEGS:
-            p = prev.get(leg, 0.0)
-            t = target.get(leg, 0.0)
-            max_d = self._max_dshares.get(leg, 100_000)
-            d = np.clip(t - p, -max_d, max_d)
-            result[leg] = p + d
-        return result
+        delta = target_arr - prev_arr
+        np.clip(delta, -self._max_dshares_arr, self._max_dshares_arr, out=delta)
+        return prev_arr + delta
 
     def reset(self):
         """Reset allocator state (e.g., at start of new period)."""
-        self._prev_pos = {leg: 0.0 for leg in self.LEGS}
+        self._prev_arr = np.zeros(self._n, dtype=np.float64)
         self._positions.clear()
         self._current_tick = 0
@@ -9,7 +9,9 @@ Usage:
 
 import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -22,6 +24,38 @@ from params import StrategyParams, DEFAULT_PARAMS_PATH
 from runner import StrategyRunner
 from sizer import FixedSizer
 from stalker import SessionLoader
+from strategies.base import get_mid
+
+
+def _fill_math(is_buy: bool, qty: float, price: float,
+               q: float, avg: float, realized: float) -> tuple[float, float, float]:
+    """Position-update math for one fill: (quantity, avg price, realized PnL).
+
+    Kept free of dict/object access so numba can compile it to native code;
+    runs as plain Python when numba is unavailable. Folding the long/short
+    symmetry through the trade sign leaves one hot same-side branch and one
+    cold reduce/flip branch instead of four.
+    """
+    s = 1.0 if is_buy else -1.0
+    if s * q >= 0.0:
+        # Same side (or flat): weighted-average entry price
+        size = s * q  # |q|
+        q += s * qty
+        avg = (avg * size + price * qty) / (size + qty) if size + qty else 0.0
+    else:
+        # Reducing or flipping
+        realized += s * (avg - price) * min(qty, -s * q)
+        q += s * qty
+        if s * q > 0.0:
+            avg = price  # Flipped through flat; remainder opens at fill price
+    return q, avg, realized
+
+
+try:
+    from numba import njit
+    _fill_math = njit(cache=True)(_fill_math)
+except ImportError:
+    pass
 
 
 @dataclass
@@ -41,7 +75,7 @@ class BacktestResult:
         return self.wins / total if total > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Track position for PnL calculation."""
     ticker: str
@@ -53,7 +87,7 @@ class Position:
 class BacktestRunner:
     """Run strategies on historical data and track simulated PnL."""
 
-    def __init__(self, params: StrategyParams, scale: int = 1) -> None:
+    def __init__(self, params: StrategyParams, scale: int = 1, n_ticks: int = 0) -> None:
         self.params = params
         self.scale = scale
         self.sizer = FixedSizer(scale)
@@ -75,16 +109,40 @@ class BacktestRunner:
         for strategy in self.runner.strategies:
             self.results[strategy.strategy_id] = BacktestResult(strategy.strategy_id)
 
-        # PnL curves
-        self.pnl_curves: dict[str, list[float]] = {}
+        # Running realized PnL per strategy, updated on each closing fill so
+        # process_tick never rescans the positions dict
+        self._realized_total: dict[str, float] = {sid: 0.0 for sid in self.results}
+        self._realized_total['allocator'] = 0.0
+
+        # PnL curves: preallocated float64 buffers (grown on demand if the
+        # n_ticks hint is absent or wrong), trimmed to _pnl_len at read time
+        self._pnl_cap = n_ticks if n_ticks > 0 else 4096
+        self.pnl_curves: dict[str, np.ndarray] = {}
+        self._pnl_len: dict[str, int] = {}
         for strategy in self.runner.strategies:
-            self.pnl_curves[strategy.strategy_id] = []
+            self.pnl_curves[strategy.strategy_id] = np.empty(self._pnl_cap, dtype=np.float64)
+            self._pnl_len[strategy.strategy_id] = 0
 
         # Add allocator tracking if enabled
         if self.runner.allocator:
             self.positions['allocator'] = {}
             self.results['allocator'] = BacktestResult('allocator')
-            self.pnl_curves['allocator'] = []
+            self.pnl_curves['allocator'] = np.empty(self._pnl_cap, dtype=np.float64)
+            self._pnl_len['allocator'] = 0
+
+        # SoA mirrors of position quantity/avg price, aligned to the market's
+        # ticker order, so unrealized PnL is one vector op per strategy
+        self._tickers = market.all_tickers
+        self._tix = {t: i for i, t in enumerate(self._tickers)}
+        self._pos_qty: dict[str, np.ndarray] = {
+            sid: np.zeros(len(self._tickers), dtype=np.float64) for sid in self.results}
+        self._pos_avg: dict[str, np.ndarray] = {
+            sid: np.zeros(len(self._tickers), dtype=np.float64) for sid in self.results}
+
+        # Warm the fill kernel before the tick loop: with numba installed the
+        # first call compiles (or reloads the on-disk cache); without it this
+        # is a no-op arithmetic call.
+        _fill_math(True, 0.0, 0.0, 0.0, 0.0, 0.0)
 
     def _get_price(self, portfolio: dict, ticker: str, side: str) -> float:
         """Get execution price (bid for sell, ask for buy)."""
@@ -120,62 +178,57 @@ class BacktestRunner:
         # No additional cost - spread is already in fill price (buy at ask, sell at bid)
         cost = 0.0
 
-        # Update position
-        if side == 'BUY':
-            if pos.quantity >= 0:
-                # Adding to long
-                total_cost = pos.avg_price * pos.quantity + price * qty
-                pos.quantity += qty
-                pos.avg_price = total_cost / pos.quantity if pos.quantity else 0
-            else:
-                # Closing short
-                pnl = (pos.avg_price - price) * min(qty, -pos.quantity)
-                pos.realized_pnl += pnl
-                pos.quantity += qty
-                if pos.quantity > 0:
-                    pos.avg_price = price
-        else:  # SELL
-            if pos.quantity <= 0:
-                # Adding to short
-                total_cost = pos.avg_price * (-pos.quantity) + price * qty
-                pos.quantity -= qty
-                pos.avg_price = total_cost / (-pos.quantity) if pos.quantity else 0
-            else:
-                # Closing long
-                pnl = (price - pos.avg_price) * min(qty, pos.quantity)
-                pos.realized_pnl += pnl
-                pos.quantity -= qty
-                if pos.quantity < 0:
-                    pos.avg_price = price
+        # Update position via the compiled kernel; only bookkeeping stays here
+        q, avg, realized = _fill_math(
+            side == 'BUY', float(qty), price,
+            float(pos.quantity), pos.avg_price, pos.realized_pnl,
+        )
+        self._realized_total[strategy_id] += realized - pos.realized_pnl
+        pos.quantity = int(q)
+        pos.avg_price = avg
+        pos.realized_pnl = realized
+
+        # Mirror into the SoA arrays used for unrealized PnL
+        i = self._tix[ticker]
+        self._pos_qty[strategy_id][i] = pos.quantity
+        self._pos_avg[strategy_id][i] = avg
 
         if debug:
             print(f'    pos after:  qty={pos.quantity}, avg={pos.avg_price:.2f}, realized={pos.realized_pnl:.2f}')
 
         return cost
 
-    def _compute_unrealized_pnl(self, strategy_id: str, portfolio: dict) -> float:
-        """Compute unrealized PnL for a strategy."""
-        unrealized = 0.0
-        for ticker, pos in self.positions[strategy_id].items():
-            if pos.quantity == 0:
-                continue
-            sec = portfolio.get(ticker, {})
-            bid = sec.get('bid', 0)
-            ask = sec.get('ask', 0)
-            mid = (bid + ask) / 2 if bid and ask else sec.get('last', 0)
-            if pos.quantity > 0:
-                unrealized += (mid - pos.avg_price) * pos.quantity
-            else:
-                unrealized += (pos.avg_price - mid) * (-pos.quantity)
-        return unrealized
+    def _tick_mids(self, portfolio: dict) -> np.ndarray:
+        """Mid prices for all tickers, in SoA order."""
+        return np.fromiter((get_mid(portfolio.get(t, {})) for t in self._tickers),
+                           dtype=np.float64, count=len(self._tickers))
+
+    def _compute_unrealized_pnl(self, strategy_id: str, mid_arr: np.ndarray) -> float:
+        """Compute unrealized PnL for a strategy.
 
-    def process_tick(self, portfolio: dict, case: dict, tick_num: int = 0, trace_first_n: int = 0) -> list:
+        (mid - avg) * qty covers both long and short holdings; flat tickers
+        contribute zero regardless of their stale avg price.
+        """
+        qty = self._pos_qty[strategy_id]
+        return float(((mid_arr - self._pos_avg[strategy_id]) * qty).sum())
+
+    def process_tick(self, portfolio: dict, case: dict, tick_num: int = 0,
+                     trace_first_n: int = 0,
+                     current_pos: dict[str, float] | None = None) -> list:
         """Process one tick through all strategies."""
-        signals = self.runner.on_tick(portfolio, case)
+        signals = self.runner.on_tick(portfolio, case, current_pos)
+
+        # Hoist instance lookups out of the per-signal loop
+        results = self.results
+        pos_qty = self._pos_qty
+        realized_total = self._realized_total
+        simulate_fill = self._simulate_fill
+        append_pnl = self._append_pnl
 
+        mid_arr = None  # Mid price array, built once per tick on first use
         for signal in signals:
             sid = signal.strategy_id
-            result = self.results[sid]
+            result = results[sid]
 
             # Enable debug for first N trades of specified strategy
             debug = (trace_first_n > 0 and
@@ -192,14 +245,19 @@ class BacktestRunner:
             # Simulate fills
             tick_cost = 0.0
             for order in signal.orders:
-                cost = self._simulate_fill(sid, portfolio, order, debug=debug)
+                cost = simulate_fill(sid, portfolio, order, debug=debug)
                 tick_cost += cost
 
             result.costs += tick_cost
 
             # Compute total PnL
-            realized = sum(p.realized_pnl for p in self.positions[sid].values())
-            unrealized = self._compute_unrealized_pnl(sid, portfolio)
+            realized = realized_total[sid]
+            if pos_qty[sid].any():
+                if mid_arr is None:
+                    mid_arr = self._tick_mids(portfolio)
+                unrealized = self._compute_unrealized_pnl(sid, mid_arr)
+            else:
+                unrealized = 0.0
             result.gross_pnl = realized + unrealized
             result.net_pnl = result.gross_pnl - result.costs
 
@@ -207,26 +265,55 @@ class BacktestRunner:
                 print(f'  realized={realized:.2f}, unrealized={unrealized:.2f}')
                 print(f'  gross={result.gross_pnl:.2f}, costs={result.costs:.2f}, net={result.net_pnl:.2f}')
 
-            self.pnl_curves[sid].append(result.net_pnl)
+            append_pnl(sid, result.net_pnl)
 
         return signals
 
-    def _compute_metrics(self, pnl_curve: list[float]) -> dict:
-        """Compute risk metrics from PnL curve using empyrical."""
-        if len(pnl_curve) < 2:
+    def process_batch(self, ticks) -> int:
+        """Process an iterable of (portfolio, case) pairs.
+
+        Bulk path for replays that need no per-tick tracing: the bound
+        method is resolved once instead of per tick. Returns the number of
+        ticks processed.
+        """
+        process_tick = self.process_tick
+        n = 0
+        for portfolio, case in ticks:
+            process_tick(portfolio, case)
+            n += 1
+        return n
+
+    def _append_pnl(self, sid: str, value: float) -> None:
+        """Append to a strategy's PnL buffer, doubling capacity when full."""
+        buf = self.pnl_curves[sid]
+        n = self._pnl_len[sid]
+        if n == buf.size:
+            buf = np.resize(buf, buf.size * 2)
+            self.pnl_curves[sid] = buf
+        buf[n] = value
+        self._pnl_len[sid] = n + 1
+
+    def _compute_metrics(self, pnl_curve, max_dd: float | None = None) -> dict:
+        """Compute risk metrics from PnL curve using empyrical.
+
+        max_dd can be supplied when it was already computed in a batched
+        pass over all curves (see summary()).
+        """
+        pnl = np.asarray(pnl_curve, dtype=np.float64)
+        if pnl.size < 2:
             return {}
 
-        pnl = np.array(pnl_curve)
         returns = np.diff(pnl) / (self.scale * 100)  # Normalize by notional
 
         # Handle edge cases
         if len(returns) == 0 or np.all(returns == 0):
             return {}
 
-        # Compute max drawdown from PnL curve (peak to trough in dollars)
-        running_max = np.maximum.accumulate(pnl)
-        drawdowns = pnl - running_max
-        max_dd = drawdowns.min()
+        if max_dd is None:
+            # Compute max drawdown from PnL curve (peak to trough in dollars)
+            running_max = np.maximum.accumulate(pnl)
+            drawdowns = pnl - running_max
+            max_dd = drawdowns.min()
 
         return {
             'sharpe': ep.sharpe_ratio(returns),
@@ -245,9 +332,20 @@ class BacktestRunner:
         total_pnl = 0.0
         all_pnl_curves = []
 
+        # Batch drawdowns: curves of equal length (the common case - every
+        # strategy appends once per tick) stack into one (S, T) pass instead
+        # of S separate accumulate/min scans.
+        curves = {sid: c[:self._pnl_len[sid]] for sid, c in self.pnl_curves.items()}
+        live = [sid for sid, arr in curves.items() if arr.size >= 2]
+        max_dds: dict[str, float] = {}
+        if len({curves[sid].size for sid in live}) == 1 and live:
+            stacked = np.vstack([curves[sid] for sid in live])
+            dd = (stacked - np.maximum.accumulate(stacked, axis=1)).min(axis=1)
+            max_dds = dict(zip(live, dd.tolist()))
+
         for sid, result in self.results.items():
-            pnl_curve = self.pnl_curves[sid]
-            metrics = self._compute_metrics(pnl_curve)
+            pnl_curve = curves[sid]
+            metrics = self._compute_metrics(pnl_curve, max_dd=max_dds.get(sid))
 
             print(f'\n{sid}:')
             print(f'  Trades:   {result.n_trades}')
@@ -265,9 +363,9 @@ class BacktestRunner:
 
         # Compute aggregate metrics
         if all_pnl_curves:
-            min_len = min(len(c) for c in all_pnl_curves)
-            combined = np.sum([np.array(c[:min_len]) for c in all_pnl_curves], axis=0)
-            agg_metrics = self._compute_metrics(combined.tolist())
+            min_len = min(c.size for c in all_pnl_curves)
+            combined = np.sum([c[:min_len] for c in all_pnl_curves], axis=0)
+            agg_metrics = self._compute_metrics(combined)
 
             print(f'\n{"=" * 60}')
             print(f'TOTAL NET PnL: ${total_pnl:,.2f}')
@@ -282,6 +380,32 @@ class BacktestRunner:
             print('=' * 60)
 
 
+def _single_strategy_params(params: StrategyParams, sid: str) -> StrategyParams:
+    """Params with only the given strategy enabled and the allocator off."""
+    return StrategyParams(
+        pair_coint=[p for p in params.pair_coint if p.strategy_id == sid],
+        etf_nav=params.etf_nav if params.etf_nav and params.etf_nav.strategy_id == sid else None,
+        width=params.width,
+        allocator=None,
+    )
+
+
+def _run_strategy_worker(session_path: str, params_path: str, scale: int, sid: str):
+    """Replay a single strategy against the recorded session.
+
+    Runs in a worker process; the session is re-read from disk locally,
+    which is cheaper than pickling the full tick stream across processes.
+    """
+    params = StrategyParams.load(params_path)
+    session = SessionLoader(session_path)
+    n_ticks = session.case.get('ticks_per_period', 0) * session.case.get('total_periods', 1)
+    bt = BacktestRunner(_single_strategy_params(params, sid), scale=scale, n_ticks=n_ticks)
+    for tick in session.ticks():
+        case = {'period': tick.period, 'tick': tick.tick, 'status': 'ACTIVE'}
+        bt.process_tick(tick.securities, case)
+    return sid, bt.results[sid], bt.pnl_curves[sid][:bt._pnl_len[sid]]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description='Backtest strategies on recorded data')
     parser.add_argument('session', nargs='?', help='Path to stalker session directory')
@@ -290,6 +414,8 @@ def main() -> None:
     parser.add_argument('--verbose', '-v', action='store_true')
     parser.add_argument('--debug', '-d', action='store_true', help='Print debug info for signals')
     parser.add_argument('--trace', '-t', type=int, default=0, help='Trace first N trades of pair_BBB_DDD')
+    parser.add_argument('--parallel', '-j', action='store_true',
+                        help='Replay strategies in parallel processes (independent mode only)')
     args = parser.parse_args()
 
     init_logging(console_level='DEBUG' if args.verbose else 'WARNING')
@@ -315,8 +441,28 @@ def main() -> None:
     print(f'Strategies: {len(params.pair_coint)} pair + {"1 ETF-NAV" if params.etf_nav else "0 ETF-NAV"}')
     print(f'Scale: {args.scale}x')
 
-    # Run backtest
-    bt = BacktestRunner(params, scale=args.scale)
+    # Run backtest (size PnL buffers from the recorded case length)
+    n_ticks = session.case.get('ticks_per_period', 0) * session.case.get('total_periods', 1)
+    bt = BacktestRunner(params, scale=args.scale, n_ticks=n_ticks)
+
+    # Independent strategies replay against the same recorded ticks with no
+    # shared state, so they can be fanned out one-per-process. The allocator
+    # couples strategies through shared positions and stays serial, as do
+    # debug/trace runs.
+    if (args.parallel and not args.debug and args.trace == 0
+            and not (params.allocator and params.allocator.enabled)):
+        sids = [s.strategy_id for s in bt.runner.strategies]
+        print(f'Replaying {len(sids)} strategies in parallel...')
+        with ProcessPoolExecutor(max_workers=min(len(sids), os.cpu_count() or 1)) as ex:
+            futures = [ex.submit(_run_strategy_worker, str(session_path), args.params, args.scale, sid)
+                       for sid in sids]
+            for f in futures:
+                sid, result, curve = f.result()
+                bt.results[sid] = result
+                bt.pnl_curves[sid] = curve
+                bt._pnl_len[sid] = curve.size
+        bt.summary()
+        return
 
     # Debug: collect stats
     debug_data = {
@@ -330,11 +476,11 @@ def main() -> None:
         portfolio = tick.securities
         case = {'period': tick.period, 'tick': tick.tick, 'status': 'ACTIVE'}
 
-        # Inject tracked positions into portfolio for allocator
+        # Hand simulated positions to the allocator without touching the
+        # recorded portfolio dicts
+        current_pos = None
         if bt.runner.allocator and 'allocator' in bt.positions:
-            for ticker, pos in bt.positions['allocator'].items():
-                if ticker in portfolio:
-                    portfolio[ticker]['position'] = pos.quantity
+            current_pos = {t: p.quantity for t, p in bt.positions['allocator'].items()}
 
         # Collect debug info before processing
         if args.debug:
@@ -358,7 +504,8 @@ def main() -> None:
             spread = etf_mid - nav
             debug_data['etf_nav']['spread'].append(spread)
 
-        signals = bt.process_tick(portfolio, case, tick_num=tick_count, trace_first_n=args.trace)
+        signals = bt.process_tick(portfolio, case, tick_num=tick_count,
+                                  trace_first_n=args.trace, current_pos=current_pos)
 
         # Track entries/exits
         if args.debug:
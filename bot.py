@@ -10,6 +10,10 @@ from runner import StrategyRunner
 from settings import settings
 from sizer import FixedSizer
 
+# Display order for verbose/dashboard position output
+DASH_TICKERS = ('ETF', 'AAA', 'BBB', 'CCC', 'DDD', 'IND')
+_EMPTY: dict = {}
+
 
 def run(params_path: str = None, scale: int = 1000, verbose: bool = False,
         dashboard: bool = False) -> None:
@@ -34,32 +38,36 @@ def run(params_path: str = None, scale: int = 1000, verbose: bool = False,
     sizer = FixedSizer(scale)
     runner = StrategyRunner(client, params, market, sizer=sizer)
 
-    # Main loop
+    # Main loop: fixed cadence against a monotonic deadline, so tick work
+    # time doesn't stretch the polling interval
     tick_count = 0
+    next_deadline = time.monotonic()
     while True:
-        case = client.get_case()
+        case, portfolio = client.get_tick_state()
         if case.get('status') != 'ACTIVE':
             logging.info('Market closed.')
             break
 
-        portfolio = client.get_portfolio()
         signals = runner.on_tick(portfolio, case)
 
+        # Securities in display order, fetched once for both outputs below
+        want_verbose = verbose and tick_count % 10 == 0
+        if dashboard or want_verbose:
+            secs = [(t, portfolio.get(t, _EMPTY)) for t in DASH_TICKERS]
+
         # Verbose: print signal info every 10 ticks
-        if verbose and tick_count % 10 == 0:
+        if want_verbose:
             for sig in signals:
                 logging.info('SIGNAL: %s | %s | %s', sig.strategy_id, sig.action, sig.reason)
             # Print current positions
-            pos_str = ', '.join(f'{t}:{portfolio.get(t, {}).get("position", 0)}'
-                               for t in ['ETF', 'AAA', 'BBB', 'CCC', 'DDD', 'IND'])
+            pos_str = ', '.join(f'{t}:{sec.get("position", 0)}' for t, sec in secs)
             logging.info('POSITIONS: %s', pos_str)
 
         # Update dashboard
         if dashboard:
             # Build positions dict for dashboard
             positions = {}
-            for ticker in ['ETF', 'AAA', 'BBB', 'CCC', 'DDD', 'IND']:
-                sec = portfolio.get(ticker, {})
+            for ticker, sec in secs:
                 bid = sec.get('bid', 0)
                 ask = sec.get('ask', 0)
                 mid = (bid + ask) / 2 if bid and ask else sec.get('last', 0)
@@ -95,7 +103,13 @@ def run(params_path: str = None, scale: int = 1000, verbose: bool = False,
             )
 
         tick_count += 1
-        time.sleep(settings.poll_interval)
+        next_deadline += settings.poll_interval
+        sleep_s = next_deadline - time.monotonic()
+        if sleep_s > 0:
+            time.sleep(sleep_s)
+        else:
+            # Fell behind; resync rather than bursting to catch up
+            next_deadline = time.monotonic()
 
 
 if __name__ == '__main__':
@@ -1,19 +1,20 @@
-"""Simple real-time dashboard using Flask + Server-Sent Events."""
+"""Simple real-time dashboard: stdlib threaded HTTP server + Server-Sent Events."""
 
+import gzip
+import hashlib
 import json
 import logging
-from threading import Thread
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Condition, Thread
 
-from flask import Flask, Response, render_template_string
+try:
+    import orjson  # C encoder; much faster float/dict serialization
+except ImportError:
+    orjson = None
 
-app = Flask(__name__)
-app.logger.setLevel(logging.WARNING)
-
-# Suppress Flask/Werkzeug request logs
-log = logging.getLogger('werkzeug')
-log.setLevel(logging.WARNING)
-
-# Global state updated by bot
+# Latest state snapshot published by the bot. The dict is never mutated in
+# place: update_state builds a fresh one and swaps the reference, so readers
+# always serialize an internally consistent frame.
 state = {
     'tick': 0,
     'period': 1,
@@ -25,6 +26,23 @@ state = {
     'spreads': {},
 }
 
+# Streams block on _cond until update_state bumps _rev, so clients receive
+# events only when the state actually changes; the serialized payload is
+# cached per revision and shared across all connected clients.
+_cond = Condition()
+_rev = 0
+_payload = ''
+_payload_rev = -1
+
+
+def _serialize(rev: int) -> str:
+    """Serialize state for the given revision. Caller must hold _cond."""
+    global _payload, _payload_rev
+    if _payload_rev != rev:
+        _payload = orjson.dumps(state).decode() if orjson else json.dumps(state)
+        _payload_rev = rev
+    return _payload
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
@@ -227,21 +245,62 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# The page is static for the life of the process: encode and compress it
+# once at import, and derive an ETag so repeat visits get a 304
+_INDEX_BYTES = HTML_TEMPLATE.encode()
+_INDEX_GZ = gzip.compress(_INDEX_BYTES)
+_INDEX_ETAG = f'"{hashlib.md5(_INDEX_BYTES).hexdigest()}"'
+
+
+class _DashboardHandler(BaseHTTPRequestHandler):
+    """Serves the static page and the SSE stream; one thread per connection."""
+
+    def do_GET(self):
+        if self.path == '/':
+            self._serve_index()
+        elif self.path == '/stream':
+            self._serve_stream()
+        else:
+            self.send_error(404)
 
-@app.route('/')
-def index():
-    return render_template_string(HTML_TEMPLATE)
+    def _serve_index(self):
+        if self.headers.get('If-None-Match') == _INDEX_ETAG:
+            self.send_response(304)
+            self.send_header('ETag', _INDEX_ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = _INDEX_GZ
+            self.send_header('Content-Encoding', 'gzip')
+        else:
+            body = _INDEX_BYTES
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'public, max-age=3600')
+        self.send_header('ETag', _INDEX_ETAG)
+        self.end_headers()
+        self.wfile.write(body)
 
+    def _serve_stream(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        last_rev = -1
+        try:
+            while True:
+                with _cond:
+                    _cond.wait_for(lambda: _rev != last_rev)
+                    last_rev = _rev
+                    payload = _serialize(last_rev)
+                self.wfile.write(f'data: {payload}\n\n'.encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client disconnected
 
-@app.route('/stream')
-def stream():
-    def generate():
-        import time
-        while True:
-            yield f"data: {json.dumps(state)}\n\n"
-            time.sleep(0.5)
-    return Response(generate(), mimetype='text/event-stream',
-                    headers={'Cache-Control': 'no-cache'})
+    def log_message(self, format, *args):
+        pass  # Suppress per-request logging
 
 
 def update_state(tick: int, period: int, pnl: float,
@@ -259,18 +318,28 @@ def update_state(tick: int, period: int, pnl: float,
         strategy_stats: Dict of {strategy_name: {'pnl': float, 'sharpe': float, 'active_ticks': int}}
         spreads: Dict of {strategy_name: {'signal': float, 'sigma': float, 'strength': float}}
     """
-    state['tick'] = tick
-    state['period'] = period
-    state['pnl'] = pnl
-    state['positions'] = positions
-    state['active_strategies'] = active
-    state['strategy_stats'] = strategy_stats or {}
-    state['spreads'] = spreads or {}
+    global _rev, state
+    snapshot = {
+        'tick': tick,
+        'period': period,
+        'pnl': pnl,
+        'positions': positions,
+        'signals': [],
+        'active_strategies': active,
+        'strategy_stats': strategy_stats or {},
+        'spreads': spreads or {},
+    }
+    with _cond:
+        state = snapshot
+        _rev += 1
+        _cond.notify_all()
 
 
 def run_dashboard(port: int = 5000) -> None:
     """Run dashboard server (call from background thread)."""
-    app.run(host='0.0.0.0', port=port, threaded=True, use_reloader=False)
+    server = ThreadingHTTPServer(('0.0.0.0', port), _DashboardHandler)
+    server.daemon_threads = True
+    server.serve_forever()
 
 
 def start_dashboard(port: int = 5000) -> Thread:
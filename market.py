@@ -23,13 +23,23 @@ class Market:
         """Calculate ETF NAV as average of underlying stock prices."""
         return sum(prices[s] for s in self.stocks) / len(self.stocks)
 
+    def _exposures(self, positions: dict[str, float], prices: dict[str, float]) -> tuple[float, float]:
+        """Gross and net exposure in a single pass over the legs."""
+        gross = 0.0
+        net = 0.0
+        for t in self.all_tickers:
+            v = positions.get(t, 0) * prices.get(t, 0)
+            gross += v if v >= 0 else -v
+            net += v
+        return gross, net
+
     def gross_exposure(self, positions: dict[str, float], prices: dict[str, float]) -> float:
         """Sum of absolute position values."""
-        return sum(abs(positions.get(t, 0) * prices.get(t, 0)) for t in self.all_tickers)
+        return self._exposures(positions, prices)[0]
 
     def net_exposure(self, positions: dict[str, float], prices: dict[str, float]) -> float:
         """Sum of position values (longs and shorts net out)."""
-        return sum(positions.get(t, 0) * prices.get(t, 0) for t in self.all_tickers)
+        return self._exposures(positions, prices)[1]
 
     def check_limits(
         self,
@@ -39,8 +49,7 @@ class Market:
         net_limit: float = 10_000_000.0,
     ) -> tuple[bool, float, float]:
         """Check if within risk limits. Returns (ok, gross, net)."""
-        gross = self.gross_exposure(positions, prices)
-        net = self.net_exposure(positions, prices)
+        gross, net = self._exposures(positions, prices)
         ok = gross <= gross_limit and abs(net) <= net_limit
         return ok, gross, net
 
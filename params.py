@@ -67,7 +67,7 @@ class EtfNavParams:
         return 'etf_nav'
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocatorConfig:
     """Portfolio allocator configuration."""
     gross_limit: float = 50_000_000.0
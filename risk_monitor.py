@@ -20,29 +20,36 @@ class SpreadStats:
     
     # Recent values for rolling window
     recent_values: deque = field(default_factory=lambda: deque(maxlen=100))
-    
+
+    # Rolling sums over recent_values, so std is O(1) per update
+    _sum: float = 0.0
+    _sumsq: float = 0.0
+
     def update(self, value: float) -> None:
         """Update statistics with a new spread value."""
         self.current = value
         self.min = min(self.min, value)
         self.max = max(self.max, value)
         self.count += 1
+
+        # Maintain rolling sums: subtract the value the deque is about to evict
+        if len(self.recent_values) == self.recent_values.maxlen:
+            old = self.recent_values[0]
+            self._sum -= old
+            self._sumsq -= old * old
         self.recent_values.append(value)
-        
+        self._sum += value
+        self._sumsq += value * value
+
         # Update mean using online algorithm
         self.mean += (value - self.mean) / self.count
-        
-        # Update std using online algorithm (Welford's method)
-        if self.count > 1:
-            # For simplicity, recalculate std from recent values
-            if len(self.recent_values) > 1:
-                recent_mean = sum(self.recent_values) / len(self.recent_values)
-                variance = sum((x - recent_mean) ** 2 for x in self.recent_values) / len(self.recent_values)
-                self.std = math.sqrt(variance)
-            else:
-                # Fallback: use expanding window
-                variance = sum((x - self.mean) ** 2 for x in self.recent_values) / len(self.recent_values)
-                self.std = math.sqrt(variance) if len(self.recent_values) > 1 else 0.0
+
+        # Rolling std from the window sums
+        n = len(self.recent_values)
+        if n > 1:
+            recent_mean = self._sum / n
+            variance = self._sumsq / n - recent_mean * recent_mean
+            self.std = math.sqrt(variance) if variance > 0 else 0.0
 
 
 @dataclass
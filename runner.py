@@ -1,5 +1,7 @@
 import logging
+import math
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Protocol
 
 import numpy as np
@@ -12,8 +14,11 @@ from sizer import Sizer, UnitSizer
 from strategies import SignalStrategy, Signal, PairCointStrategy, EtfNavStrategy
 from strategies.base import get_mid
 
+# Annualization: ~780 ticks per period, 2 periods per session
+_ANNUALIZE = math.sqrt(780)
 
-@dataclass
+
+@dataclass(slots=True)
 class StrategyPnL:
     """Track PnL for a strategy based on its allocation weight."""
     name: str
@@ -27,10 +32,12 @@ class StrategyPnL:
         if len(self.pnl_history) < 10:
             return 0.0
         returns = np.diff(self.pnl_history)
-        if len(returns) == 0 or np.std(returns) < 1e-9:
+        if len(returns) == 0:
+            return 0.0
+        std = np.std(returns)
+        if std < 1e-9:
             return 0.0
-        # Annualize: ~780 ticks per period, 2 periods per session
-        return np.mean(returns) / np.std(returns) * np.sqrt(780)
+        return np.mean(returns) / std * _ANNUALIZE
 
 
 class PnLTracker:
@@ -122,7 +129,8 @@ class StrategyRunner:
         self.pnl_tracker = PnLTracker(strategy_names)
         self._last_active: list[str] = []
         self._last_weights: dict[str, float] = {}
-        self._last_spreads: dict[str, dict] = {}  # {name: {signal, sigma, strength}}
+        self._last_specs: list = []  # Specs from the latest tick; dict-ified on demand
+        self._risk_ctx: tuple[dict, dict] | None = None  # Per-tick (positions, prices)
 
         # Initialize allocator if enabled
         self.allocator: PortfolioAllocator | None = None
@@ -142,8 +150,20 @@ class StrategyRunner:
         return self.pnl_tracker.get_stats()
 
     def get_spreads(self) -> dict:
-        """Get current spread values for all strategies."""
-        return self._last_spreads.copy()
+        """Get current spread values for all strategies.
+
+        Built lazily from the last tick's specs so the trading loop never
+        pays for a dict nobody reads when the dashboard is off.
+        """
+        return {
+            s.name: {
+                'signal': s.signal,
+                'sigma': s.sigma,
+                'strength': s.strength,
+                'abs_signal': s.abs_signal,
+            }
+            for s in self._last_specs
+        }
 
     def _build_strategies(self) -> None:
         """Instantiate all enabled strategies from params."""
@@ -162,15 +182,19 @@ class StrategyRunner:
 
     def _check_risk(self, portfolio: dict, signal: Signal) -> bool:
         """Check if executing signal would exceed risk limits."""
-        # Extract current positions and prices
-        positions = {}
-        prices = {}
-        for ticker in self.market.all_tickers:
-            sec = portfolio.get(ticker, {})
-            positions[ticker] = sec.get('position', 0)
-            bid = sec.get('bid', 0)
-            ask = sec.get('ask', 0)
-            prices[ticker] = (bid + ask) / 2 if bid and ask else sec.get('last', 0)
+        # Positions and prices are extracted once per tick and shared across
+        # signals; _risk_ctx is invalidated at the top of each tick
+        if self._risk_ctx is None:
+            base_positions = {}
+            prices = {}
+            for ticker in self.market.all_tickers:
+                sec = portfolio.get(ticker, {})
+                base_positions[ticker] = sec.get('position', 0)
+                prices[ticker] = get_mid(sec)
+            self._risk_ctx = (base_positions, prices)
+        else:
+            base_positions, prices = self._risk_ctx
+        positions = dict(base_positions)
 
         # Project positions after trade
         for order in signal.orders:
@@ -223,14 +247,20 @@ class StrategyRunner:
                 except Exception as e:
                     logging.error('%s: order failed: %s', signal.strategy_id, e)
 
-    def on_tick(self, portfolio: dict, case: dict) -> list[Signal]:
-        """Process one tick across all strategies."""
+    def on_tick(self, portfolio: dict, case: dict,
+                current_pos: dict[str, float] | None = None) -> list[Signal]:
+        """Process one tick across all strategies.
+
+        current_pos optionally supplies positions directly (e.g. simulated
+        ones in a backtest) instead of reading them out of portfolio.
+        """
         if self.allocator:
-            return self._on_tick_allocated(portfolio, case)
+            return self._on_tick_allocated(portfolio, case, current_pos)
         return self._on_tick_independent(portfolio, case)
 
     def _on_tick_independent(self, portfolio: dict, case: dict) -> list[Signal]:
         """Process tick with independent strategy execution (original behavior)."""
+        self._risk_ctx = None  # New portfolio snapshot; rebuild on first risk check
         signals = []
 
         for strategy in self.strategies:
@@ -246,7 +276,8 @@ class StrategyRunner:
 
         return signals
 
-    def _on_tick_allocated(self, portfolio: dict, case: dict) -> list[Signal]:
+    def _on_tick_allocated(self, portfolio: dict, case: dict,
+                           current_pos: dict[str, float] | None = None) -> list[Signal]:
         """Process tick with top-N weighted allocation."""
         # Collect signal specs from ALL strategies (allocator decides which to use)
         specs = []
@@ -255,29 +286,29 @@ class StrategyRunner:
             if spec is not None:
                 specs.append(spec)
 
-        # Track spread values for dashboard
-        self._last_spreads = {
-            s.name: {
-                'signal': s.signal,
-                'sigma': s.sigma,
-                'strength': s.strength,
-                'abs_signal': s.abs_signal,
-            }
-            for s in specs
-        }
+        # Track specs for the dashboard; get_spreads() materializes the dict
+        self._last_specs = specs
 
-        # Get prices
-        prices = {t: get_mid(portfolio.get(t, {})) for t in self.market.all_tickers}
-
-        # Get current positions
-        current_pos = {t: portfolio.get(t, {}).get('position', 0) for t in self.market.all_tickers}
+        # Prices and positions in one pass: each security dict is looked up
+        # once and feeds both maps (positions only when the caller didn't
+        # supply simulated ones)
+        prices = {}
+        if current_pos is None:
+            current_pos = {}
+            for t in self.market.all_tickers:
+                sec = portfolio.get(t, {})
+                prices[t] = get_mid(sec)
+                current_pos[t] = sec.get('position', 0)
+        else:
+            for t in self.market.all_tickers:
+                prices[t] = get_mid(portfolio.get(t, {}))
 
         # Debug: log signal strengths
         if specs:
             above_thresh = [s for s in specs if s.abs_signal >= self.allocator.config.min_threshold]
             logging.debug('Signals: %d total, %d above threshold (%.2f)',
                          len(specs), len(above_thresh), self.allocator.config.min_threshold)
-            for s in sorted(specs, key=lambda x: x.strength, reverse=True)[:4]:
+            for s in sorted(specs, key=attrgetter('strength'), reverse=True)[:4]:
                 logging.debug('  %s: signal=%.4f sigma=%.4f strength=%.2f %s',
                              s.name, s.signal, s.sigma, s.strength,
                              '*' if s.abs_signal >= self.allocator.config.min_threshold else '')
@@ -3,8 +3,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Generator, Iterator
 
+try:
+    import orjson as _json  # C parser; decoding ticks.jsonl dominates replay IO
+except ImportError:
+    _json = json
 
-@dataclass
+
+@dataclass(slots=True)
 class Tick:
     """A single recorded tick."""
     ts: float
@@ -13,7 +18,7 @@ class Tick:
     securities: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class BookSnapshot:
     """Order book snapshot for a ticker."""
     ts: float
@@ -24,7 +29,7 @@ class BookSnapshot:
     asks: list[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """A single trade from time & sales."""
     ts: float
@@ -42,6 +47,7 @@ class SessionLoader:
     def __init__(self, session_dir: str | Path) -> None:
         self.session_dir = Path(session_dir)
         self._meta = None
+        self._tickers = None
 
     @property
     def meta(self) -> dict:
@@ -56,10 +62,13 @@ class SessionLoader:
 
     @property
     def tickers(self) -> list[str]:
-        """Get tickers from first tick."""
-        for tick in self.ticks():
-            return list(tick.securities.keys())
-        return []
+        """Get tickers from first tick (parsed once, then cached)."""
+        if self._tickers is None:
+            self._tickers = []
+            for tick in self.ticks():
+                self._tickers = list(tick.securities.keys())
+                break
+        return self._tickers
 
     def ticks(self) -> Generator[Tick, None, None]:
         """Iterate through all tick snapshots."""
@@ -69,7 +78,7 @@ class SessionLoader:
 
         with open(path) as f:
             for line in f:
-                data = json.loads(line)
+                data = _json.loads(line)
                 yield Tick(
                     ts=data['ts'],
                     period=data['period'],
@@ -85,7 +94,7 @@ class SessionLoader:
 
         with open(path) as f:
             for line in f:
-                data = json.loads(line)
+                data = _json.loads(line)
                 if ticker and data['ticker'] != ticker:
                     continue
                 book = data.get('book', {})
@@ -108,7 +117,7 @@ class SessionLoader:
 
         with open(path) as f:
             for line in f:
-                data = json.loads(line)
+                data = _json.loads(line)
                 if ticker and data['ticker'] != ticker:
                     continue
                 for t in data.get('trades', []):
@@ -141,7 +150,7 @@ class SessionLoader:
             return
         with open(path) as f:
             for line in f:
-                yield json.loads(line)
+                yield _json.loads(line)
 
 
 def list_sessions(data_dir: str | Path = 'data') -> list[Path]:
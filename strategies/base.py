@@ -40,7 +40,7 @@ class PositionState(str, Enum):
     SHORT = 'SHORT'
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """A single order to be placed."""
     ticker: str
@@ -49,7 +49,7 @@ class Order:
     price: float  # Limit price
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """What a strategy returns each tick."""
     strategy_id: str
@@ -114,7 +114,10 @@ class SpreadStrategy(SignalStrategy):
     def __init__(self, strategy_id: str) -> None:
         super().__init__(strategy_id)
         self._means: dict[int, RunningMean] = defaultdict(RunningMean)
-        self._cache: dict[tuple[int, int], float] = {}
+        # Single-slot cache: ticks arrive monotonically, so only the current
+        # tick's adjustment is ever re-requested (e.g. signal + spec paths)
+        self._cache_key: tuple[int, int] | None = None
+        self._cache_adj: float = 0.0
 
     def _adjust_for_seasonality(self, raw: float, case: dict) -> float:
         """Apply seasonality adjustment with per-tick caching."""
@@ -122,13 +125,14 @@ class SpreadStrategy(SignalStrategy):
         tick = case.get('tick', 0)
         tick_key = (period, tick)
 
-        if tick_key in self._cache:
-            return self._cache[tick_key]
+        if tick_key == self._cache_key:
+            return self._cache_adj
 
         mean = self._means[tick]
         prev = mean.get()
         adj = raw - prev if prev is not None else raw
-        self._cache[tick_key] = adj
+        self._cache_key = tick_key
+        self._cache_adj = adj
         mean.update(raw)
         return adj
 
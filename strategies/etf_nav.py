@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
+from allocator import StrategySpec
 from params import EtfNavParams
 from market import Market, market
 from .base import SpreadStrategy, Signal, Order, PositionState, get_mid
 from .pyramid import PyramidMixin
 
-if TYPE_CHECKING:
-    from allocator import StrategySpec
-
 
 class EtfNavStrategy(SpreadStrategy, PyramidMixin):
     """
@@ -183,7 +179,6 @@ class EtfNavStrategy(SpreadStrategy, PyramidMixin):
 
         spread_adj = self._adjust_for_seasonality(raw, case)
 
-        from allocator import StrategySpec
         return StrategySpec(
             name='ETF-NAV',
             signal=spread_adj,  # + = ETF overvalued = short spread (in dollars)
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING
 
+from allocator import StrategySpec
 from params import PairCointParams
 from .base import SpreadStrategy, Signal, Order, PositionState, get_mid
 from .pyramid import PyramidMixin
 
-if TYPE_CHECKING:
-    from allocator import StrategySpec
-
 
 class PairCointStrategy(SpreadStrategy, PyramidMixin):
     """
@@ -25,6 +22,13 @@ class PairCointStrategy(SpreadStrategy, PyramidMixin):
         self.params = params
         self._entry_hb: float = 0.0  # Hedge ratio locked in at entry
 
+        # Params are immutable for the life of the strategy; bind the ones
+        # read on every tick once instead of chasing params attributes
+        self._a = params.a
+        self._b = params.b
+        self._beta = params.beta
+        self._c = params.c
+
         # Cached values from compute_spread (used by make_*_orders)
         self._price_a: float = 0.0
         self._price_b: float = 0.0
@@ -37,10 +41,8 @@ class PairCointStrategy(SpreadStrategy, PyramidMixin):
         self._init_pyramid(params.pyramid)
 
     def compute_spread(self, portfolio: dict, case: dict) -> float | None:
-        a, b = self.params.a, self.params.b
-
-        self._sec_a = portfolio.get(a, {})
-        self._sec_b = portfolio.get(b, {})
+        self._sec_a = portfolio.get(self._a, {})
+        self._sec_b = portfolio.get(self._b, {})
         if not self._sec_a or not self._sec_b:
             return None
 
@@ -50,10 +52,10 @@ class PairCointStrategy(SpreadStrategy, PyramidMixin):
             return None
 
         # Dynamic hedge ratio
-        self._current_hb = self.params.beta * (self._price_a / self._price_b)
+        self._current_hb = self._beta * (self._price_a / self._price_b)
 
         # Raw z spread
-        return math.log(self._price_a) - (self.params.c + self.params.beta * math.log(self._price_b))
+        return math.log(self._price_a) - (self._c + self._beta * math.log(self._price_b))
 
     def compute_signal(self, portfolio: dict, case: dict) -> Signal:
         """Full state machine with level-based pyramiding."""
@@ -133,7 +135,7 @@ class PairCointStrategy(SpreadStrategy, PyramidMixin):
 
     def _make_orders(self, is_long: bool, quantity: float, use_entry_hb: bool = False) -> list[Order]:
         """Generate orders for given direction and quantity."""
-        a, b = self.params.a, self.params.b
+        a, b = self._a, self._b
         hb = self._entry_hb if use_entry_hb else self._current_hb
 
         if is_long:
@@ -195,7 +197,6 @@ class PairCointStrategy(SpreadStrategy, PyramidMixin):
 
         spread_adj = self._adjust_for_seasonality(raw, case)
 
-        from allocator import StrategySpec
         return StrategySpec(
             name=self.strategy_id,
             signal=spread_adj,  # Raw z-score (allocator filters by threshold)
@@ -205,8 +206,8 @@ class PairCointStrategy(SpreadStrategy, PyramidMixin):
 
     def _build_pos_per_unit(self, prices: dict) -> dict:
         """Position for +1 unit of short spread (a overvalued: sell a, buy b)."""
-        a, b = self.params.a, self.params.b
+        a, b = self._a, self._b
         pa = prices.get(a, self._price_a)
         pb = prices.get(b, self._price_b)
-        hb = self.params.beta * (pa / pb) if pb > 0 else self._current_hb
+        hb = self._beta * (pa / pb) if pb > 0 else self._current_hb
         return {a: -1.0, b: +hb}